@@ -2,18 +2,69 @@
 Orchestrator class that scrapes position data and publishes to EventHub.
 """
 
+import asyncio
 import logging
-from typing import List, Dict
+from datetime import datetime, timezone
+from typing import Optional
+import time
 import uuid
 
+import pyarrow as pa
+import pyarrow.compute as pc
+from cachetools import TTLCache
+
 from consumer.events_consumer import EventsConsumer
-from shared import Scrapper, extract_job_info, read_parquet
+from shared import (
+    Scrapper,
+    extract_job_info,
+    ipc_to_parquet,
+    is_parquet,
+    read_parquet_table,
+)
 
 from .storage_client import StorageClient
 
 
 logger = logging.getLogger(__name__)
 
+# Scraped job info is cached per URL so repeated positions across batches
+# skip the HTTP round-trip and HTML parse.
+SCRAPE_CACHE_SIZE = 10_000
+SCRAPE_CACHE_TTL = 3600
+
+# Maximum number of batches buffered between pipeline stages.
+PIPELINE_QUEUE_SIZE = 2
+
+# Known job URLs are re-scraped once their entry is older than this, so
+# postings whose content changes are picked up again.
+KNOWN_URLS_TTL = 24 * 3600
+# Number of index changes accumulated before the known-URL blob is rewritten.
+KNOWN_URLS_FLUSH_BATCHES = 10
+
+# Schema of the per-batch metadata table: the extract_job_info record plus the
+# source job_url. Fixing it keeps every _meta.parquet blob consistent, including
+# batches where all list fields are empty or no position was scraped.
+JOB_METADATA_SCHEMA = pa.schema(
+    [
+        pa.field("title", pa.string()),
+        pa.field("complexity_score", pa.int64()),
+        pa.field("category", pa.string()),
+        pa.field("seniority_level", pa.string()),
+        pa.field("requirements_count", pa.int64()),
+        pa.field("responsibilities_count", pa.int64()),
+        pa.field(
+            "details",
+            pa.struct(
+                [
+                    pa.field("requirements", pa.list_(pa.string())),
+                    pa.field("responsibilities", pa.list_(pa.string())),
+                ]
+            ),
+        ),
+        pa.field("job_url", pa.string()),
+    ]
+)
+
 
 class DataProcessor:
     """
@@ -45,9 +96,19 @@ class DataProcessor:
                 "eventhub": {"connection_string": "...", "eventhub_name": "..."},
                 "consumer": {
                     "consumer_details": {"consumer_group": "..."},
-                    "scrapper": {"scrape_timeout": 30, "scrape_rate_limit": 1},
+                    "scrapper": {
+                        "scrape_timeout": 30,
+                        "scrape_rate_per_sec": 1.0,
+                        "max_connections": 8
+                    },
                     "base_url": "https://example.com/jobs/",
-                    "bucket": "positions-data"
+                    "bucket": "positions-data",
+                    "max_concurrency": 8,
+                    "recompress": False,
+                    "known_urls_blob": "known_urls.txt",
+                    "known_urls_ttl": 86400,
+                    "known_urls_flush_batches": 10,
+                    "hourly_meta": False
                 },
                 "storage": {"connection_string": "..."}
             }
@@ -67,113 +128,343 @@ class DataProcessor:
 
         self._base_url = config["consumer"]["base_url"]
         self._bucket = config["consumer"]["bucket"]
+        self._max_concurrency = config["consumer"].get("max_concurrency", 8)
+        self._recompress = config["consumer"].get("recompress", False)
+        self._scrape_cache = TTLCache(maxsize=SCRAPE_CACHE_SIZE, ttl=SCRAPE_CACHE_TTL)
+        self._known_urls_blob = config["consumer"].get("known_urls_blob")
+        self._known_urls_ttl = config["consumer"].get("known_urls_ttl", KNOWN_URLS_TTL)
+        self._known_urls_flush_batches = config["consumer"].get(
+            "known_urls_flush_batches", KNOWN_URLS_FLUSH_BATCHES
+        )
+        # Job URL -> epoch seconds when its metadata was stored
+        self._known_urls: dict[str, float] = {}
+        self._known_urls_unsaved = 0
+        self._known_urls_value_set: Optional[pa.Array] = None
+        self._known_urls_next_expiry = float("inf")
+        self._hourly_meta = config["consumer"].get("hourly_meta", False)
 
         logger.info(
-            f"DataProcessor initialized with base_url={self._base_url}, bucket={self._bucket}"
+            "DataProcessor initialized with base_url=%s, bucket=%s, max_concurrency=%d",
+            self._base_url,
+            self._bucket,
+            self._max_concurrency,
         )
 
-    async def _scrape_job_info(
-        self, data: List[Dict[str, str]]
-    ) -> List[Dict[str, str]]:
+    async def _scrape_job_info(self, positions: pa.Table) -> pa.Table:
         """
         Scrape detailed job information for each position event.
 
         Args:
-            data (List[Dict[str, str]]): List of position events, each containing
-                at minimum a 'position_title' field
+            positions (pa.Table): Position events, containing at minimum
+                a 'job_url' column
 
         Returns:
-            List[Dict[str, str]]: List of scraped metadata for each position
+            pa.Table: Scraped metadata matching JOB_METADATA_SCHEMA, one row
+                per successfully scraped position, with the source 'job_url'
+                attached as a column
 
         Raises:
             Exception: If scraping fails for any reason
 
         Note:
-            - URLs are constructed by converting position titles to lowercase
-              and replacing spaces with hyphens
-            - All positions are processed sequentially to respect rate limits
+            - URLs are taken from the 'job_url' column; null, empty and
+              duplicate URLs are dropped with vectorized Arrow kernels
+            - Positions are scraped concurrently, bounded by max_concurrency;
+              the scraper's rate limiter still paces every request
+            - Successful results are cached by URL for SCRAPE_CACHE_TTL seconds
+            - URLs stored by a previous batch or run less than known_urls_ttl
+              seconds ago are skipped
         """
-        logger.info(f"Starting scrape for {len(data)} positions")
+        job_urls = positions.column("job_url")
+        job_urls = pc.unique(job_urls.filter(pc.not_equal(job_urls, "")))
+        if self._known_urls_blob:
+            known = self._known_url_value_set()
+            if len(known):
+                job_urls = job_urls.filter(
+                    pc.invert(pc.is_in(job_urls, value_set=known))
+                )
+        urls = job_urls.to_pylist()
+        logger.info(
+            "Starting scrape for %d/%d positions", len(urls), positions.num_rows
+        )
 
         try:
-            positions_metadata = []
-
-            for idx, event in enumerate(data):
-                url = event.get("job_url", None)
-                if not url:
-                    continue
-
-                logger.debug(f"Scraping position {idx + 1}/{len(data)}: from {url}")
+            results = {url: self._scrape_cache.get(url) for url in urls}
+            uncached = [url for url, metadata in results.items() if metadata is None]
+            logger.debug(
+                "Using cached metadata for %d positions", len(urls) - len(uncached)
+            )
 
-                metadata = await self.scraper.scrape(
-                    url=url,
-                    extractor=extract_job_info,
-                )
+            scraped = await self.scraper.scrape_many(
+                uncached, extract_job_info, max_concurrency=self._max_concurrency
+            )
+            for url, metadata in zip(uncached, scraped):
+                if metadata:
+                    self._scrape_cache[url] = metadata
+                results[url] = metadata
 
+            positions_metadata = []
+            for url in urls:
+                metadata = results[url]
                 if metadata:
-                    positions_metadata.append(metadata)
-                    logger.debug(f"Successfully scraped metadata for {url}")
+                    positions_metadata.append({**metadata, "job_url": url})
+                    logger.debug("Successfully scraped metadata for %s", url)
                 else:
-                    logger.warning(f"No metadata extracted for {url}")
+                    logger.warning("No metadata extracted for %s", url)
+
+            metadata_table = pa.Table.from_pylist(
+                positions_metadata, schema=JOB_METADATA_SCHEMA
+            )
 
             logger.info(
-                f"Successfully scraped {len(positions_metadata)}/{len(data)} positions"
+                "Successfully scraped %d/%d positions",
+                metadata_table.num_rows,
+                positions.num_rows,
             )
-            return positions_metadata
+            return metadata_table
 
         except Exception as e:
-            logger.error(f"Failed to scrape positions: {e}", exc_info=True)
+            logger.error("Failed to scrape positions: %s", e, exc_info=True)
             raise
 
+    async def _consume_stage(self, scrape_queue: asyncio.Queue) -> None:
+        """
+        Pipeline stage: consume parquet payloads from EventHub.
+
+        Args:
+            scrape_queue (asyncio.Queue): Queue receiving (batch_id, parquet)
+
+        Note:
+            EventHub is received through the async client, so the scrape and
+            upload stages keep making progress while waiting for events.
+        """
+        batch_count = 0
+        while True:
+            async for positions_parquet in self.consumer.consume():
+                batch_count += 1
+                logger.info("Consumed batch %d", batch_count)
+                await scrape_queue.put((batch_count, positions_parquet))
+
+    async def _scrape_stage(
+        self, scrape_queue: asyncio.Queue, upload_queue: asyncio.Queue
+    ) -> None:
+        """
+        Pipeline stage: read each batch and scrape its job information.
+
+        Args:
+            scrape_queue (asyncio.Queue): Queue yielding (batch_id, parquet)
+            upload_queue (asyncio.Queue): Queue receiving
+                (batch_id, parquet, metadata)
+        """
+        while True:
+            batch_id, positions_parquet = await scrape_queue.get()
+            logger.info("Processing batch %d", batch_id)
+
+            if not is_parquet(positions_parquet):
+                # Small batches arrive as Arrow IPC; store them as parquet too
+                logger.debug("Converting Arrow IPC payload to parquet")
+                positions_parquet = await asyncio.to_thread(
+                    ipc_to_parquet, positions_parquet
+                )
+
+            logger.debug("Reading parquet data")
+            # Parquet decoding releases the GIL, so running it in a worker
+            # thread lets in-flight scrapes and uploads keep progressing
+            positions = await asyncio.to_thread(
+                read_parquet_table, positions_parquet, columns=["job_url"]
+            )
+            logger.info("Read %d position records from parquet", positions.num_rows)
+
+            logger.debug("Scraping job information")
+            metadata = await self._scrape_job_info(positions)
+
+            await upload_queue.put((batch_id, positions_parquet, metadata))
+            del positions_parquet, positions, metadata
+
+    async def _upload_stage(self, upload_queue: asyncio.Queue) -> None:
+        """
+        Pipeline stage: upload each batch and its metadata to blob storage.
+
+        Args:
+            upload_queue (asyncio.Queue): Queue yielding
+                (batch_id, parquet, metadata)
+
+        Note:
+            With hourly_meta enabled, metadata is appended to one JSON Lines
+            blob per UTC hour (meta/YYYY/MM/DD/HH.jsonl) instead of a
+            {file_id}_meta.parquet blob per batch. Batches with no scraped
+            metadata store only the positions parquet.
+        """
+        while True:
+            batch_id, positions_parquet, metadata = await upload_queue.get()
+
+            file_id = uuid.uuid4().hex
+            logger.info("Uploading batch %d with file_id=%s", batch_id, file_id)
+
+            # Batches where nothing new was scraped store no metadata blob
+            has_metadata = metadata.num_rows > 0
+            upload = self._storage_client.upload(
+                data=positions_parquet,
+                meta=metadata if has_metadata and not self._hourly_meta else None,
+                container_name=self._bucket,
+                filename=file_id,
+                recompress=self._recompress,
+            )
+            if self._hourly_meta and has_metadata:
+                bucket_name = datetime.now(timezone.utc).strftime(
+                    "meta/%Y/%m/%d/%H.jsonl"
+                )
+                await asyncio.gather(
+                    upload,
+                    self._storage_client.append_meta(
+                        metadata.to_pylist(), self._bucket, bucket_name
+                    ),
+                )
+            else:
+                await upload
+            logger.info("Batch %d uploaded successfully", batch_id)
+
+            if self._known_urls_blob and has_metadata:
+                stored_at = time.time()
+                for url in metadata.column("job_url").to_pylist():
+                    self._known_urls[url] = stored_at
+                self._known_urls_value_set = None
+                self._known_urls_unsaved += 1
+                if self._known_urls_unsaved >= self._known_urls_flush_batches:
+                    await self._save_known_urls()
+
+            del positions_parquet, metadata
+
+    def _known_url_value_set(self) -> pa.Array:
+        """
+        Return the unexpired known job URLs as an Arrow array.
+
+        The array is cached and only rebuilt after the index changes or its
+        oldest entry reaches known_urls_ttl; expired entries are dropped from
+        the index at that point.
+
+        Returns:
+            pa.Array: Known job URLs, for use as a pc.is_in value set
+        """
+        now = time.time()
+        if self._known_urls_value_set is None or now >= self._known_urls_next_expiry:
+            cutoff = now - self._known_urls_ttl
+            live = {url: ts for url, ts in self._known_urls.items() if ts > cutoff}
+            if len(live) != len(self._known_urls):
+                logger.info(
+                    "Expired %d known job URLs", len(self._known_urls) - len(live)
+                )
+                self._known_urls = live
+                self._known_urls_unsaved += 1
+
+            self._known_urls_value_set = pa.array(list(live), type=pa.string())
+            self._known_urls_next_expiry = (
+                min(live.values()) + self._known_urls_ttl if live else float("inf")
+            )
+
+        return self._known_urls_value_set
+
+    async def _load_known_urls(self) -> None:
+        """
+        Load the index of already-scraped job URLs from blob storage.
+
+        Each line holds a URL and the epoch seconds it was stored, separated
+        by a tab; lines without a timestamp are treated as stored now, and
+        lines with an unparseable timestamp are skipped.
+        """
+        text = await self._storage_client.download_text(
+            self._bucket, self._known_urls_blob
+        )
+        now = time.time()
+        self._known_urls = {}
+        skipped = 0
+        for line in text.splitlines() if text else ():
+            url, _, stored_at = line.partition("\t")
+            if not url:
+                continue
+            try:
+                self._known_urls[url] = float(stored_at) if stored_at else now
+            except ValueError:
+                skipped += 1
+        if skipped:
+            logger.warning("Skipped %d malformed known job URL lines", skipped)
+        self._known_urls_value_set = None
+        logger.info("Loaded %d known job URLs", len(self._known_urls))
+
+    async def _save_known_urls(self) -> None:
+        """Persist the index of already-scraped job URLs to blob storage."""
+        await self._storage_client.upload_text(
+            self._bucket,
+            self._known_urls_blob,
+            "\n".join(f"{url}\t{ts:.0f}" for url, ts in self._known_urls.items()),
+        )
+        self._known_urls_unsaved = 0
+        logger.debug("Saved %d known job URLs", len(self._known_urls))
+
     async def run(self) -> None:
         """
         Execute the main data processing pipeline.
 
-        The pipeline:
+        The pipeline runs three concurrent stages connected by bounded queues,
+        so consecutive batches overlap:
         1. Consumes position events from EventHub in batches
-        2. Reads parquet data for each batch
-        3. Scrapes detailed job information
-        4. Uploads data and metadata to blob storage
+        2. Reads parquet data for each batch and scrapes detailed job information
+        3. Uploads data and metadata to blob storage
 
         Raises:
             Exception: If any step in the pipeline fails
 
         Note:
-            The scraper session is always closed in the finally block,
-            even if an error occurs during processing.
+            - Each queue holds at most PIPELINE_QUEUE_SIZE batches, bounding
+              memory while a slower stage catches up
+            - The EventHub consumer, scraper session and storage client are
+              always closed in the finally block, even if an error occurs
+              during processing.
+            - Unsaved known-URL index changes are flushed before closing;
+              during the run the index is written every
+              known_urls_flush_batches changes rather than after each batch
         """
+        scrape_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        upload_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stages = []
+
         try:
             logger.info("Starting DataProcessor pipeline")
 
-            batch_count = 0
-            while True:
-                for positions_parquet in self.consumer.consume():
-                    batch_count += 1
-                    logger.info(f"Processing batch {batch_count}")
-
-                    logger.debug("Reading parquet data")
-                    data = read_parquet(positions_parquet)
-                    logger.info(f"Read {len(data)} position records from parquet")
-
-                    logger.debug("Scraping job information")
-                    metadata = await self._scrape_job_info(data)
-
-                    file_id = uuid.uuid4()
-                    logger.info(f"Uploading batch {batch_count} with file_id={file_id}")
+            await self.scraper.start()
 
-                    self._storage_client.upload(
-                        data=data,
-                        meta=metadata,
-                        container_name=self._bucket,
-                        filename=str(file_id),
-                    )
+            if self._known_urls_blob:
+                await self._load_known_urls()
 
-                    logger.info(f"Batch {batch_count} uploaded successfully")
+            stages = [
+                asyncio.create_task(self._consume_stage(scrape_queue)),
+                asyncio.create_task(self._scrape_stage(scrape_queue, upload_queue)),
+                asyncio.create_task(self._upload_stage(upload_queue)),
+            ]
+            await asyncio.gather(*stages)
 
         except Exception as e:
-            logger.error(f"DataProcessor pipeline failed: {e}", exc_info=True)
+            logger.error("DataProcessor pipeline failed: %s", e, exc_info=True)
             raise
 
         finally:
+            for stage in stages:
+                stage.cancel()
+            # Let cancelled stages unwind before their clients are closed
+            await asyncio.gather(*stages, return_exceptions=True)
+
+            if self._known_urls_blob and self._known_urls_unsaved:
+                logger.info("Flushing known job URL index")
+                try:
+                    await self._save_known_urls()
+                except Exception as e:
+                    logger.error("Failed to flush known job URLs: %s", e)
+
+            logger.info("Closing EventHub consumer")
+            await self.consumer.close()
+
             logger.info("Closing scraper session")
             await self.scraper.close()
+
+            logger.info("Closing storage client")
+            await self._storage_client.close()
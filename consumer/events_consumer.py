@@ -1,20 +1,24 @@
-from azure.eventhub import EventHubConsumerClient, EventData, PartitionContext
+from azure.eventhub import EventData
+from azure.eventhub.aio import EventHubConsumerClient, PartitionContext
+from typing import AsyncIterator, Optional
+import asyncio
+import contextlib
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Received events buffered ahead of consume(), in multiples of max_events
+EVENT_BUFFER_BATCHES = 4
+
 
 class EventsConsumer:
     """
     Azure EventHub consumer for position data events.
 
-    Consumes events in batches from EventHub and collects them as raw bytes.
-    The consumer automatically closes after reaching max_events or when the
-    batch is complete.
-
-    Attributes:
-        collected_data (List[bytes]): Accumulated event data from the current batch
+    Consumes events in batches from EventHub and yields them as raw bytes as
+    soon as they arrive. A single long-lived receive keeps the client connected
+    across consume() calls; the connection is only torn down by close().
     """
 
     def __init__(
@@ -36,8 +40,11 @@ class EventsConsumer:
             max_wait_time (int): Maximum wait time in seconds for events
         """
         logger.info(
-            f"Initializing EventsConsumer for eventhub={eventhub_name}, "
-            f"consumer_group={consumer_group}, max_events={max_events}"
+            "Initializing EventsConsumer for eventhub=%s, "
+            "consumer_group=%s, max_events=%d",
+            eventhub_name,
+            consumer_group,
+            max_events,
         )
 
         self._client = self._build_client(
@@ -45,7 +52,11 @@ class EventsConsumer:
         )
         self._max_events = max_events
         self._max_wait_time = max_wait_time
-        self.collected_data = []
+        # Room for several batches, so the receive callback only waits when
+        # the pipeline is genuinely behind rather than on every handoff
+        self._buffer_size = max_events * EVENT_BUFFER_BATCHES
+        self._events: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self._buffer_size)
+        self._receive_task: Optional[asyncio.Task] = None
 
         logger.debug("EventsConsumer initialized successfully")
 
@@ -53,7 +64,7 @@ class EventsConsumer:
         self, conn_string: str, eventhub_name: str, consumer_group: str
     ) -> EventHubConsumerClient:
         """
-        Build the EventHub consumer client.
+        Build the async EventHub consumer client.
 
         Args:
             conn_string (str): EventHub connection string
@@ -63,14 +74,14 @@ class EventsConsumer:
         Returns:
             EventHubConsumerClient: Configured EventHub consumer client
         """
-        logger.debug(f"Building EventHub client for {eventhub_name}")
+        logger.debug("Building EventHub client for %s", eventhub_name)
         return EventHubConsumerClient.from_connection_string(
             conn_str=conn_string,
             eventhub_name=eventhub_name,
             consumer_group=consumer_group,
         )
 
-    def _consume_callback(
+    async def _consume_callback(
         self, context: PartitionContext, events: list[EventData]
     ) -> None:
         """
@@ -81,56 +92,94 @@ class EventsConsumer:
             events (List[EventData]): Batch of events to process
 
         Note:
-            - Collects event bodies as bytes
-            - Automatically closes client when max_events is reached
+            - Hands event bodies to consume() as bytes through a queue of
+              max_events * EVENT_BUFFER_BATCHES events
+            - When that queue is full the callback blocks on put(), and the
+              SDK does not service this partition's receive loop until it
+              returns; a pipeline stalled for longer than that buffer stalls
+              the partition with it
+            - No checkpoint is written: the client has no checkpoint store and
+              receiving always starts from "@latest"
         """
-        logger.debug(f"Consuming batch of {len(events)} events")
+        logger.debug("Consuming batch of %d events", len(events))
 
         for event in events:
+            # The producer sends single-section bodies, which bytes.join
+            # returns as-is without copying.
             event_body = b"".join(event.body)
-            self.collected_data.append(event_body)
-            logger.debug(f"Collected event ({len(event_body)} bytes)")
+            await self._events.put(event_body)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Collected event (%d bytes)", len(event_body))
 
-        # Close client when we've reached our goal
-        if len(self.collected_data) >= self._max_events:
-            logger.info(f"Reached max_events ({self._max_events}), closing client")
-            self._client.close()
-
-    def consume(self) -> list[bytes]:
+    async def _receive(self) -> None:
         """
-        Consume events from EventHub in batches.
+        Receive events for the lifetime of the consumer.
 
-        Returns:
-            List[bytes]: List of event bodies as raw bytes
-
-        Note:
-            - Resets collected_data before consuming
-            - Starts from the beginning of the stream (position "-1")
-            - Blocks until max_events is reached or max_wait_time expires
+        Runs as a background task started by the first consume() call, so the
+        AMQP connection and links are negotiated once instead of per batch.
         """
-        logger.info("Starting event consumption")
-        self.collected_data = []
-
         try:
-            with self._client:
+            async with self._client:
                 logger.debug(
-                    f"Receiving batch (max_batch_size={self._max_events}, "
-                    f"max_wait_time={self._max_wait_time}s)"
+                    "Receiving batches (max_batch_size=%d, max_wait_time=%ss)",
+                    self._max_events,
+                    self._max_wait_time,
                 )
 
-                self._client.receive_batch(
+                await self._client.receive_batch(
                     on_event_batch=self._consume_callback,
                     max_batch_size=self._max_events,
-                    starting_position="@latest",  # From the beginning of the stream
+                    starting_position="@latest",  # Only events sent from now on
                     max_wait_time=self._max_wait_time,
+                    prefetch=self._buffer_size,
                 )
 
-            logger.info(
-                f"Consumption complete. Collected {len(self.collected_data)} events"
-            )
-
         except Exception as e:
-            logger.error(f"Error during event consumption: {e}", exc_info=True)
+            logger.error("Error during event consumption: %s", e, exc_info=True)
             raise
 
-        return self.collected_data
+    async def consume(self) -> AsyncIterator[bytes]:
+        """
+        Consume events from EventHub in batches.
+
+        Yields:
+            bytes: Event bodies as raw bytes
+
+        Note:
+            - Starts the background receive on first use
+            - Yields each event as soon as it is received, stopping after
+              max_events or once no event arrives within max_wait_time
+            - Re-raises any error that stopped the background receive
+        """
+        logger.info("Starting event consumption")
+
+        if self._receive_task is None:
+            self._receive_task = asyncio.create_task(self._receive())
+
+        collected = 0
+        while collected < self._max_events:
+            if self._receive_task.done():
+                self._receive_task.result()
+
+            try:
+                event_body = await asyncio.wait_for(
+                    self._events.get(), timeout=self._max_wait_time
+                )
+            except asyncio.TimeoutError:
+                break
+
+            collected += 1
+            yield event_body
+
+        logger.info("Consumption complete. Collected %d events", collected)
+
+    async def close(self) -> None:
+        """Stop the background receive and close the EventHub client."""
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._receive_task
+            self._receive_task = None
+
+        logger.debug("Closing EventHub client")
+        await self._client.close()
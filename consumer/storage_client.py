@@ -1,17 +1,55 @@
-from azure.storage.blob import BlobServiceClient
+from azure.core.exceptions import (
+    ResourceExistsError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
+from azure.storage.blob.aio import BlobServiceClient, ContainerClient
+from typing import Optional
+import asyncio
+import io
 import logging
-import json
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 logger = logging.getLogger(__name__)
 
+# Payloads smaller than this are uploaded as-is; re-encoding them costs more
+# CPU than the bytes it saves.
+RECOMPRESS_MIN_BYTES = 1024 * 1024
+
+
+def _recompress_parquet(data: bytes) -> bytes:
+    """
+    Re-encode a parquet payload with zstd unless it already uses zstd.
+
+    Args:
+        data (bytes): Raw parquet data
+
+    Returns:
+        bytes: zstd-compressed parquet data, or the input if unchanged
+    """
+    parquet_file = pq.ParquetFile(pa.BufferReader(data))
+    metadata = parquet_file.metadata
+    if (
+        metadata.num_row_groups
+        and metadata.row_group(0).column(0).compression == "ZSTD"
+    ):
+        return data
+
+    buffer = io.BytesIO()
+    pq.write_table(parquet_file.read(), buffer, compression="zstd", compression_level=3)
+    return buffer.getvalue()
+
 
 class StorageClient:
     """
     Azure Blob Storage client for uploading position data and metadata.
 
-    Handles uploading of parquet data files and their associated JSON metadata
-    to Azure Blob Storage containers.
+    Handles uploading of parquet data files and their associated parquet metadata
+    to Azure Blob Storage containers. Uses the async SDK so that independent
+    blob uploads can run concurrently.
     """
 
     def __init__(self, connection_string: str):
@@ -26,11 +64,12 @@ class StorageClient:
         """
         logger.info("Initializing StorageClient")
         self.client = self._create_client(connection_string=connection_string)
+        self._containers: dict[str, ContainerClient] = {}
         logger.debug("StorageClient initialized successfully")
 
     def _create_client(self, connection_string: str) -> BlobServiceClient:
         """
-        Create Azure Blob Service client.
+        Create async Azure Blob Service client.
 
         Args:
             connection_string (str): Azure connection string
@@ -51,56 +90,190 @@ class StorageClient:
             logger.error(f"Failed to create BlobServiceClient: {e}", exc_info=True)
             raise
 
-    def upload(
-        self, data: list, meta: list, container_name: str, filename: str
+    def _container(self, name: str) -> ContainerClient:
+        """
+        Get the cached container client for a container.
+
+        Args:
+            name (str): Container name
+
+        Returns:
+            ContainerClient: Client reused for every blob in the container
+        """
+        if name not in self._containers:
+            logger.debug(f"Creating ContainerClient for {name}")
+            self._containers[name] = self.client.get_container_client(name)
+        return self._containers[name]
+
+    async def upload(
+        self,
+        data: bytes,
+        meta: Optional[pa.Table],
+        container_name: str,
+        filename: str,
+        recompress: bool = False,
     ) -> None:
         """
         Upload data and metadata to Azure Blob Storage.
 
-        Uploads two blobs:
+        Uploads two blobs concurrently:
         1. {filename} - The raw parquet data
-        2. {filename}_meta.json - The metadata as JSON
+        2. {filename}_meta.parquet - The metadata as zstd-compressed parquet,
+           skipped when meta is None
 
         Args:
             data (bytes): Raw parquet data to upload
-            meta (dict): Metadata dictionary to upload as JSON
+            meta (Optional[pa.Table]): Metadata table to upload as parquet
             container_name (str): Target container name
             filename (str): Base filename (without extension)
+            recompress (bool): Re-encode the parquet data with zstd before
+                uploading when it is at least RECOMPRESS_MIN_BYTES
 
         Raises:
+            TypeError: If filename is not a string
             Exception: If upload fails for either blob
 
         Note:
-            Both uploads use overwrite=True to replace existing files
+            - Both uploads use overwrite=True to replace existing files
+            - The parquet payload is streamed from a BytesIO view so the SDK
+              can chunk it without making a second copy
+            - Recompression runs in a worker thread to keep the event loop free
         """
+        if not isinstance(filename, str):
+            raise TypeError(f"filename must be a str, got {type(filename).__name__}")
+
         logger.info(f"Uploading to container={container_name}, filename={filename}")
 
         try:
+            container_client = self._container(container_name)
+
             # Upload parquet data
+            if recompress and len(data) >= RECOMPRESS_MIN_BYTES:
+                original_size = len(data)
+                data = await asyncio.to_thread(_recompress_parquet, data)
+                logger.debug(
+                    f"Recompressed data blob with zstd: {original_size} -> {len(data)} bytes"
+                )
+
             data_blob_name = f"{filename}"
             logger.debug(f"Uploading data blob: {data_blob_name} ({len(data)} bytes)")
 
-            blob_client = self.client.get_blob_client(
-                container=container_name, blob=data_blob_name
-            )
-            blob_client.upload_blob(json.dumps(data), overwrite=True)
-            logger.info(f"Data blob uploaded: {data_blob_name}")
+            data_blob_client = container_client.get_blob_client(data_blob_name)
+            uploads = [
+                data_blob_client.upload_blob(
+                    io.BytesIO(data),
+                    length=len(data),
+                    overwrite=True,
+                    max_concurrency=8,
+                )
+            ]
 
             # Upload metadata
-            meta_blob_name = f"{filename}_meta.json"
-            meta_json = json.dumps(meta)
-            logger.debug(
-                f"Uploading metadata blob: {meta_blob_name} ({len(meta_json)} bytes)"
-            )
+            if meta is not None:
+                meta_blob_name = f"{filename}_meta.parquet"
+                meta_buffer = io.BytesIO()
+                pq.write_table(
+                    meta,
+                    meta_buffer,
+                    compression="zstd",
+                    use_dictionary=True,
+                )
+                meta_size = meta_buffer.getbuffer().nbytes
+                meta_buffer.seek(0)
+                logger.debug(
+                    f"Uploading metadata blob: {meta_blob_name} ({meta_size} bytes)"
+                )
 
-            blob_client = self.client.get_blob_client(
-                container=container_name, blob=meta_blob_name
-            )
-            blob_client.upload_blob(meta_json, overwrite=True)
-            logger.info(f"Metadata blob uploaded: {meta_blob_name}")
+                meta_blob_client = container_client.get_blob_client(meta_blob_name)
+                uploads.append(
+                    meta_blob_client.upload_blob(
+                        meta_buffer, length=meta_size, overwrite=True
+                    )
+                )
+
+            await asyncio.gather(*uploads)
 
             logger.info(f"Upload complete for {filename}")
 
         except Exception as e:
             logger.error(f"Error uploading to Azure Blob Storage: {e}", exc_info=True)
             raise
+
+    async def append_meta(
+        self, meta: list[dict], container_name: str, blob_name: str
+    ) -> None:
+        """
+        Append metadata records to a JSON Lines append blob.
+
+        The append blob is created on first use, so a time-bucketed blob name
+        collects the metadata of every batch in that bucket.
+
+        Args:
+            meta (list[dict]): Metadata records, written one JSON object per line
+            container_name (str): Target container name
+            blob_name (str): Append blob name
+
+        Raises:
+            Exception: If creating or appending to the blob fails
+        """
+        if not meta:
+            logger.debug(f"No metadata to append to {blob_name}")
+            return
+
+        try:
+            blob_client = self._container(container_name).get_blob_client(blob_name)
+            try:
+                await blob_client.create_append_blob(if_none_match="*")
+                logger.info(f"Created append blob: {blob_name}")
+            except (ResourceExistsError, ResourceModifiedError):
+                pass  # Another batch in this bucket already created it
+
+            block = b"".join(orjson.dumps(record) + b"\n" for record in meta)
+            logger.debug(f"Appending metadata to {blob_name} ({len(block)} bytes)")
+            await blob_client.append_block(block)
+
+        except Exception as e:
+            logger.error(f"Error appending metadata to {blob_name}: {e}", exc_info=True)
+            raise
+
+    async def download_text(self, container_name: str, blob_name: str) -> Optional[str]:
+        """
+        Download a text blob.
+
+        Args:
+            container_name (str): Source container name
+            blob_name (str): Blob name
+
+        Returns:
+            Optional[str]: Blob contents, or None if the blob does not exist
+        """
+        try:
+            downloader = await self._container(container_name).download_blob(
+                blob_name, encoding="utf-8"
+            )
+            return await downloader.readall()
+
+        except ResourceNotFoundError:
+            logger.info(f"Blob not found: {container_name}/{blob_name}")
+            return None
+
+    async def upload_text(self, container_name: str, blob_name: str, text: str) -> None:
+        """
+        Upload a text blob, replacing any existing one.
+
+        Args:
+            container_name (str): Target container name
+            blob_name (str): Blob name
+            text (str): Blob contents
+        """
+        logger.debug(f"Uploading text blob: {blob_name} ({len(text)} chars)")
+        await self._container(container_name).upload_blob(
+            blob_name, text.encode("utf-8"), overwrite=True
+        )
+
+    async def close(self) -> None:
+        """Close the underlying blob service client and its connections."""
+        logger.debug("Closing BlobServiceClient")
+        # Container clients share this client's transport, so closing it is enough
+        self._containers.clear()
+        await self.client.close()
@@ -12,12 +12,12 @@ logging.basicConfig(
 
 
 async def main():
-    publisher = ScraperPublisher(
+    async with ScraperPublisher(
         **config["eventhub"],
         **config["producer"]["scrapper"],
         schema={"position_title": "string", "index": "string", "job_url": "string"},
-    )
-    await publisher.run()
+    ) as publisher:
+        await publisher.run()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,11 @@ Scrapes job positions, enriches data, and publishes to Kafka.
 """
 
 import logging
-from azure.eventhub import EventHubProducerClient, EventData
+
+import pyarrow as pa
+from azure.eventhub import EventData
+from azure.eventhub.aio import EventHubProducerClient
+from azure.eventhub.exceptions import EventHubError
 
 
 logger = logging.getLogger(__name__)
@@ -30,11 +34,46 @@ class PositionProducer:
             logger.error(f"Failed to create EventHub producer: {e}")
             raise
 
-    def publish(self, data: bytes):
+    async def publish(self, data: bytes | memoryview | pa.Buffer):
+        await self.publish_many([data])
+
+    async def publish_many(self, payloads: list[bytes | memoryview | pa.Buffer]):
+        """
+        Publish payloads as events, packing as many as fit into each batch.
+
+        A batch is sent only when the next event no longer fits under the
+        hub's maximum batch size, so several payloads share one AMQP send.
+
+        Args:
+            payloads: Event bodies to publish, one event per payload
+
+        Raises:
+            ValueError: If a single payload exceeds the maximum batch size
+
+        Note:
+            The client connection stays open between calls; call close() when
+            done publishing.
+        """
         try:
-            with self.producer:
-                self.producer.send_batch([EventData(data)])
+            batch = await self.producer.create_batch()
+            for data in payloads:
+                event = EventData(memoryview(data))
+                try:
+                    batch.add(event)
+                except ValueError:
+                    if not len(batch):
+                        raise
+                    await self.producer.send_batch(batch)
+                    batch = await self.producer.create_batch()
+                    batch.add(event)
 
-        except Exception as e:
+            if len(batch):
+                await self.producer.send_batch(batch)
+
+        except (EventHubError, ValueError) as e:
             logger.error(f"Error publishing to EventHub: {e}", exc_info=True)
             raise
+
+    async def close(self):
+        """Close the EventHub producer connection."""
+        await self.producer.close()
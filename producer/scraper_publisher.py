@@ -2,27 +2,37 @@
 Orchestrator that scrapes position data and publishes to EventHub.
 
 Example:
-    >>> publisher = ScraperPublisher(
+    >>> async with ScraperPublisher(
     ...     scrape_url="https://careers.company.com/positions",
     ...     connection_string="Endpoint=sb://...",
     ...     eventhub_name="positions",
     ...     scrape_timeout=30,
-    ...     scrape_rate_limit=1,
+    ...     scrape_rate_per_sec=1.0,
     ...     schema={"id": "string", "title": "string"}
-    ... )
-    >>> await publisher.run()
+    ... ) as publisher:
+    ...     await publisher.run()
 """
 
 import logging
 from typing import List, Dict
-from datetime import datetime
-
-from shared import Scrapper, extract_positions, create_parquet
+import time
+
+from shared import (
+    Scrapper,
+    build_schema,
+    create_arrow_ipc,
+    create_parquet,
+    extract_positions,
+)
 from producer.producer import PositionProducer
 
 
 logger = logging.getLogger(__name__)
 
+# Up to this many positions an Arrow IPC stream is smaller than Parquet,
+# whose footer and column metadata dominate tiny payloads
+ARROW_IPC_MAX_ROWS = 10
+
 
 class ScraperPublisher:
     """
@@ -37,7 +47,7 @@ class ScraperPublisher:
         connection_string: str,
         eventhub_name: str,
         scrape_timeout: int,
-        scrape_rate_limit: int,
+        scrape_rate_per_sec: float,
         schema: Dict[str, str],
     ):
         """
@@ -48,17 +58,17 @@ class ScraperPublisher:
             connection_string: EventHub connection string
             eventhub_name: EventHub name
             scrape_timeout: Timeout for scraping requests in seconds
-            scrape_rate_limit: Delay between requests in seconds
+            scrape_rate_per_sec: Maximum scrape requests started per second
             schema: Field name to Parquet type mapping
         """
         logger.info("Initializing ScraperPublisher for %s", scrape_url)
 
         self.scrape_url = scrape_url
-        self.schema = schema
+        self.schema = build_schema(schema)
 
         self.scraper = Scrapper(
             scrape_timeout=scrape_timeout,
-            scrape_rate_limit=scrape_rate_limit,
+            scrape_rate_per_sec=scrape_rate_per_sec,
         )
 
         self.producer = PositionProducer(
@@ -76,32 +86,33 @@ class ScraperPublisher:
             List of position dictionaries
 
         Raises:
-            Exception: If scraping fails
+            RuntimeError: If the listing page could not be scraped
         """
         logger.info("Scraping positions from %s", self.scrape_url)
 
-        try:
-            positions = await self.scraper.scrape(
-                url=self.scrape_url,
-                extractor=extract_positions,
-            )
-
-            logger.info("Scraped %d positions", len(positions))
-            return positions
+        positions = await self.scraper.scrape(
+            url=self.scrape_url,
+            extractor=extract_positions,
+        )
+        if positions is None:
+            raise RuntimeError(f"Scraping failed for {self.scrape_url}")
 
-        except Exception as e:
-            logger.error("Scraping failed: %s", e, exc_info=True)
-            raise
+        logger.info("Scraped %d positions", len(positions))
+        return positions
 
-    def _publish_positions(self, positions: List[Dict[str, str]]) -> None:
+    async def _publish_positions(self, positions: List[Dict[str, str]]) -> None:
         """
         Convert positions to Parquet and publish to EventHub.
 
+        Batches of at most ARROW_IPC_MAX_ROWS positions are sent as an Arrow
+        IPC stream instead, which is smaller than Parquet at that size.
+
         Args:
             positions: List of position dictionaries
 
         Raises:
-            Exception: If publishing fails
+            ValueError: If the payload could not be built or is too large
+            EventHubError: If sending to EventHub fails
         """
         if not positions:
             logger.warning("No positions to publish")
@@ -109,24 +120,24 @@ class ScraperPublisher:
 
         logger.info("Publishing %d positions", len(positions))
 
-        try:
-            # Convert to Parquet
-            parquet_data = create_parquet(positions, schema=self.schema)
-
-            if not parquet_data:
-                logger.error("Failed to create Parquet data")
-                raise ValueError("Parquet conversion returned empty data")
+        # Convert to Arrow IPC or Parquet
+        if len(positions) <= ARROW_IPC_MAX_ROWS:
+            payload_format = "Arrow IPC"
+            payload = create_arrow_ipc(positions, schema=self.schema)
+        else:
+            payload_format = "Parquet"
+            payload = create_parquet(positions, schema=self.schema)
 
-            logger.debug("Created Parquet: %.2f KB", len(parquet_data) / 1024)
+        if not payload:
+            logger.error("Failed to create %s data", payload_format)
+            raise ValueError(f"{payload_format} conversion returned empty data")
 
-            # Publish to EventHub
-            self.producer.publish(parquet_data)
+        logger.debug("Created %s: %.2f KB", payload_format, len(payload) / 1024)
 
-            logger.info("Successfully published %d positions", len(positions))
+        # Publish to EventHub
+        await self.producer.publish(payload)
 
-        except Exception as e:
-            logger.error("Publishing failed: %s", e, exc_info=True)
-            raise
+        logger.info("Successfully published %d positions", len(positions))
 
     async def run(self) -> None:
         """
@@ -135,28 +146,31 @@ class ScraperPublisher:
         Raises:
             Exception: If any step fails
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info("Starting pipeline")
 
         try:
+            await self.scraper.start()
+
             # Scrape
             positions = await self._scrape_positions()
 
             # Publish
-            self._publish_positions(positions)
+            await self._publish_positions(positions)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.info("Pipeline completed in %.2fs", duration)
 
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.error("Pipeline failed after %.2fs: %s", duration, e, exc_info=True)
             raise
 
-    def close(self) -> None:
-        """Close producer connection."""
+    async def close(self) -> None:
+        """Close the scraper session and producer connection."""
         logger.info("Closing ScraperPublisher")
-        self.producer.close()
+        await self.scraper.close()
+        await self.producer.close()
 
     async def __aenter__(self):
         """Context manager entry."""
@@ -164,5 +178,5 @@ class ScraperPublisher:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
+        await self.close()
         return False
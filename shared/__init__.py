@@ -1,4 +1,12 @@
-from .parquet_tools import create_parquet, read_parquet
+from .parquet_tools import (
+    build_schema,
+    create_arrow_ipc,
+    create_parquet,
+    ipc_to_parquet,
+    is_parquet,
+    read_parquet,
+    read_parquet_table,
+)
 from .scrapper import extract_job_info, extract_positions, Scrapper
 from .config import config
 
@@ -7,7 +15,11 @@ __all__ = [
     "extract_job_info",
     "extract_positions",
     "create_parquet",
+    "create_arrow_ipc",
+    "ipc_to_parquet",
+    "is_parquet",
     "read_parquet",
+    "read_parquet_table",
     "build_schema",
     "config",
 ]
@@ -1,11 +1,21 @@
+import functools
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
+
+@functools.cache
 def load_config() -> dict:
     """
     Load and parse configuration from config.yaml
     Returns a dictionary with all configuration values
+
+    The file is parsed once with the libyaml C loader when PyYAML was built
+    with it; later calls return the same dictionary.
     """
     config_path = Path(__file__).parent.parent / "config.yaml"
 
@@ -13,7 +23,7 @@ def load_config() -> dict:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_Loader)
 
     return config
 
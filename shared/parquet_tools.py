@@ -1,8 +1,14 @@
-import pandas as pd
-from venv import logger
+import logging
+from functools import lru_cache
+
 import pyarrow as pa
 import pyarrow.parquet as pq
-import io
+
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of every Parquet file; Arrow IPC streams start differently
+PARQUET_MAGIC = b"PAR1"
 
 
 type_map = {
@@ -13,42 +19,112 @@ type_map = {
 }
 
 
-def _build_schema(schema: dict) -> pa.Schema:
+def build_schema(schema: dict) -> pa.Schema:
     fields = [pa.field(name, type_map[dtype]) for name, dtype in schema.items()]
     return pa.schema(fields)
 
 
-def create_parquet(data: list[dict], schema, compression="snappy") -> bytes:
+@lru_cache(maxsize=8)
+def _build_schema_cached(items: tuple) -> pa.Schema:
+    return build_schema(dict(items))
+
+
+def _build_table(data: list[dict], schema: dict | pa.Schema) -> pa.Table:
+    # Callers that publish repeatedly pass a pre-built pa.Schema
+    if not isinstance(schema, pa.Schema):
+        schema = _build_schema_cached(tuple(schema.items()))
+    return pa.Table.from_pylist(data, schema=schema)
+
+
+def create_parquet(
+    data: list[dict],
+    schema: dict | pa.Schema,
+    compression="zstd",
+    compression_level=3,
+) -> pa.Buffer:
     if not data:
         logger.warning("No data provided to create Parquet file")
         return
 
     try:
-        df = pd.DataFrame(data)
-        schema = _build_schema(schema)
-        table = pa.Table.from_pandas(df, schema=schema)
+        table = _build_table(data, schema)
+
+        # Write into an arrow-owned buffer; getvalue() hands it out without
+        # the full-payload copy BytesIO.getvalue() makes
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            table, sink, compression=compression, compression_level=compression_level
+        )
+
+        return sink.getvalue()
+
+    except (pa.ArrowException, KeyError) as e:
+        logger.error(f"Error creating Parquet file: {e}")
+        raise
+
+
+def create_arrow_ipc(data: list[dict], schema: dict | pa.Schema) -> pa.Buffer:
+    """
+    Serialize rows as an Arrow IPC stream.
+
+    For a handful of rows this is smaller than Parquet, whose footer and
+    per-column metadata outweigh the data itself.
+    """
+    if not data:
+        logger.warning("No data provided to create Arrow IPC stream")
+        return
+
+    try:
+        table = _build_table(data, schema)
 
-        buf = io.BytesIO()
-        pq.write_table(table, buf, compression=compression)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
 
-        parquet_bytes = buf.getvalue()
+        return sink.getvalue()
+
+    except (pa.ArrowException, KeyError) as e:
+        logger.error(f"Error creating Arrow IPC stream: {e}")
+        raise
 
-        return parquet_bytes
 
-    except Exception as e:
-        logger.error(f"Error creating Parquet file: {e}", exc_info=True)
+def is_parquet(payload) -> bool:
+    return bytes(memoryview(payload)[: len(PARQUET_MAGIC)]) == PARQUET_MAGIC
+
+
+def ipc_to_parquet(payload, compression="zstd", compression_level=3) -> pa.Buffer:
+    try:
+        table = pa.ipc.open_stream(payload).read_all()
+
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            table, sink, compression=compression, compression_level=compression_level
+        )
+
+        return sink.getvalue()
+
+    except pa.ArrowException as e:
+        logger.error(f"Error converting Arrow IPC stream to Parquet: {e}")
+        raise
+
+
+def read_parquet_table(parquet, columns: list[str] | None = None) -> pa.Table:
+    try:
+        buffer = pa.BufferReader(parquet)
+        return pq.read_table(buffer, columns=columns)
+
+    except pa.ArrowException as e:
+        logger.error(f"Error reading Parquet table: {e}")
         raise
 
 
-def read_parquet(parquet) -> list[dict]:
+def read_parquet(parquet, columns: list[str] | None = None) -> list[dict]:
     try:
-        buffer = io.BytesIO(parquet)
-        table = pq.read_table(buffer)
-        df = table.to_pandas()
-        records = df.to_dict(orient="records")
-        return records
+        buffer = pa.BufferReader(parquet)
+        table = pq.read_table(buffer, columns=columns)
+        return table.to_pylist()
 
-    except Exception as e:
+    except pa.ArrowException as e:
         logger.error(
             f"Failed to read Parquet bytes: {str(e)}",
             extra={"component": "parquet", "tags": {"error": type(e).__name__}},
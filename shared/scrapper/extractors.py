@@ -1,15 +1,181 @@
-from bs4 import BeautifulSoup
 import re
-from bs4 import BeautifulSoup
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional
 
-import re
-from bs4 import BeautifulSoup
-from typing import Dict, List, Tuple
+from lxml import etree, html as lxml_html
+
+
+def _class_xpath(tag: str, class_name: str, axis: str = "//") -> str:
+    """
+    Build an XPath matching the first `tag` whose class list contains `class_name`.
+    """
+    return (
+        f"({axis}{tag}[contains(concat(' ', normalize-space(@class), ' '), "
+        f"' {class_name} ')])[1]"
+    )
+
+
+# Compiled once at import; evaluating them walks the DOM in C
+_TITLE_XPATH = etree.XPath("string((//h1)[1])")
+# Visible page text; like BeautifulSoup's get_text(), skips script/style/template
+_PAGE_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+_REQUIREMENT_ITEMS_XPATH = etree.XPath(
+    _class_xpath("div", "career-text-block__wrp--data--requirements") + "//li"
+)
+_RESPONSIBILITY_ITEMS_XPATH = etree.XPath(
+    _class_xpath("div", "careers-text-block__desc") + "//li"
+)
+_JOB_LINKS_XPATH = etree.XPath("(//div[@id='response_jobs'])[1]//a")
+_LINK_TITLE_XPATH = etree.XPath(_class_xpath("span", "link-text", axis=".//"))
+
+
+# lxml refuses str input that carries an encoding declaration; the page is
+# already decoded, so the declaration is dropped before parsing.
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def _parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse an HTML document, returning None when it has no content.
+    """
+    html = _XML_DECLARATION_RE.sub("", html, count=1)
+    if not html.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except etree.ParserError:
+        # Comment- or whitespace-only documents have no root element
+        return None
+
+
+# Keyword tables used by the scoring helpers. Matching stays on plain substring
+# scans: `keyword in text` runs CPython's C fastsearch and, for lists this
+# short, beats a single compiled alternation regex by 3-4x because `re`
+# backtracks at every text position instead of scanning once.
+_SENIORITY_SCORE_KEYWORDS = (
+    "lead",
+    "senior",
+    "principal",
+    "staff",
+    "architect",
+    "director",
+    "head",
+    "chief",
+)
+
+_COMPLEXITY_KEYWORDS = (
+    "state-of-the-art",
+    "cutting-edge",
+    "research",
+    "phd",
+    "deep learning",
+    "machine learning",
+    "ai",
+    "algorithm",
+    "architecture",
+    "distributed",
+    "scalability",
+    "real-time",
+    "end-to-end",
+    "full cycle",
+    "generative",
+)
+
+# Checked in order; the first category with a matching keyword wins
+_CATEGORY_KEYWORDS = (
+    (
+        "Engineering",
+        (
+            "engineer",
+            "developer",
+            "software",
+            "algorithm",
+            "backend",
+            "frontend",
+            "full stack",
+            "devops",
+            "sre",
+            "data engineer",
+            "ml",
+            "ai",
+            "nlp",
+            "computer vision",
+            "infrastructure",
+            "architect",
+            "technical",
+        ),
+    ),
+    (
+        "Product",
+        (
+            "product manager",
+            "product owner",
+            "pm",
+            "product lead",
+            "product strategy",
+            "roadmap",
+            "stakeholder",
+        ),
+    ),
+    (
+        "Design",
+        (
+            "designer",
+            "ux",
+            "ui",
+            "user experience",
+            "user interface",
+            "graphic design",
+            "visual design",
+            "design system",
+        ),
+    ),
+    (
+        "Operations",
+        (
+            "operations",
+            "ops manager",
+            "program manager",
+            "project manager",
+            "scrum master",
+            "agile coach",
+            "business operations",
+            "customer success",
+        ),
+    ),
+)
+
+_LEAD_TITLE_KEYWORDS = ("lead", "principal", "staff", "director", "head", "chief")
+_SENIOR_TITLE_KEYWORDS = ("senior", "sr.")
+_JUNIOR_TITLE_KEYWORDS = ("junior", "jr.", "entry", "associate")
+_ADVANCED_DEGREE_KEYWORDS = ("phd", "ph.d", "m.sc", "master")
+_LEADERSHIP_KEYWORDS = (
+    "lead team",
+    "mentor",
+    "autonomy",
+    "independently",
+    "ownership",
+    "drive",
+    "strategy",
+    "architecture decision",
+)
+
+
+# "5 years", "5+ years" and "3-5 years" in a single scan; a range counts as
+# its larger bound
+_YEARS_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+)|\+?)\s*years")
+
+
+def _contains_any(keywords: tuple, *texts: str) -> bool:
+    """
+    Check whether any of the keywords occurs as a substring of any of the texts.
+    """
+    return any(keyword in text for text in texts for keyword in keywords)
 
 
 def _calculate_complexity_score(
-    title: str, full_text: str, requirements: List[str]
+    title_lower: str, full_text: str, experience_years: int, requirements: List[str]
 ) -> int:
     """
     Calculate complexity score (0-100) based on various factors.
@@ -20,7 +186,6 @@ def _calculate_complexity_score(
     skill_score = min(35, num_requirements * 5)
     score += skill_score
 
-    experience_years = _extract_years_experience(full_text)
     if experience_years >= 7:
         score += 30
     elif experience_years >= 5:
@@ -30,40 +195,12 @@ def _calculate_complexity_score(
     elif experience_years >= 1:
         score += 10
 
-    seniority_keywords = [
-        "lead",
-        "senior",
-        "principal",
-        "staff",
-        "architect",
-        "director",
-        "head",
-        "chief",
-    ]
-    title_lower = title.lower()
-    for keyword in seniority_keywords:
-        if keyword in title_lower:
-            score += 20
-            break
-
-    complexity_keywords = [
-        "state-of-the-art",
-        "cutting-edge",
-        "research",
-        "phd",
-        "deep learning",
-        "machine learning",
-        "ai",
-        "algorithm",
-        "architecture",
-        "distributed",
-        "scalability",
-        "real-time",
-        "end-to-end",
-        "full cycle",
-        "generative",
-    ]
-    complexity_count = sum(1 for keyword in complexity_keywords if keyword in full_text)
+    if _contains_any(_SENIORITY_SCORE_KEYWORDS, title_lower):
+        score += 20
+
+    complexity_count = sum(
+        1 for keyword in _COMPLEXITY_KEYWORDS if keyword in full_text
+    )
     score += min(15, complexity_count * 2)
 
     return min(100, score)
@@ -73,135 +210,41 @@ def _extract_years_experience(text: str) -> int:
     """
     Extract years of experience required from text.
     """
-    patterns = [
-        r"(\d+)\+?\s*years",
-        r"(\d+)\s*-\s*(\d+)\s*years",
-    ]
-
-    max_years = 0
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            if isinstance(match, tuple):
-                years = max(int(y) for y in match if y.isdigit())
-            else:
-                years = int(match)
-            max_years = max(max_years, years)
-
-    return max_years
+    return max(
+        (max(int(low), int(high or 0)) for low, high in _YEARS_RE.findall(text)),
+        default=0,
+    )
 
 
-def _categorize_position(
-    title: str, full_text: str, responsibilities: List[str]
-) -> str:
+def _categorize_position(title_lower: str, full_text: str) -> str:
     """
     Categorize position into: Engineering, Product, Design, Operations, or Other.
     """
-    title_lower = title.lower()
-    combined_text = (title + " " + full_text).lower()
-
-    engineering_keywords = [
-        "engineer",
-        "developer",
-        "software",
-        "algorithm",
-        "backend",
-        "frontend",
-        "full stack",
-        "devops",
-        "sre",
-        "data engineer",
-        "ml",
-        "ai",
-        "nlp",
-        "computer vision",
-        "infrastructure",
-        "architect",
-        "technical",
-    ]
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if _contains_any(keywords, title_lower, full_text):
+            return category
 
-    product_keywords = [
-        "product manager",
-        "product owner",
-        "pm",
-        "product lead",
-        "product strategy",
-        "roadmap",
-        "stakeholder",
-    ]
+    return "Other"
 
-    design_keywords = [
-        "designer",
-        "ux",
-        "ui",
-        "user experience",
-        "user interface",
-        "graphic design",
-        "visual design",
-        "design system",
-    ]
-
-    operations_keywords = [
-        "operations",
-        "ops manager",
-        "program manager",
-        "project manager",
-        "scrum master",
-        "agile coach",
-        "business operations",
-        "customer success",
-    ]
 
-    if any(keyword in combined_text for keyword in engineering_keywords):
-        return "Engineering"
-    elif any(keyword in combined_text for keyword in product_keywords):
-        return "Product"
-    elif any(keyword in combined_text for keyword in design_keywords):
-        return "Design"
-    elif any(keyword in combined_text for keyword in operations_keywords):
-        return "Operations"
-    else:
-        return "Other"
-
-
-def _determine_seniority(title: str, full_text: str, requirements: List[str]) -> str:
+def _determine_seniority(
+    title_lower: str, full_text: str, years_exp: int, requirements: List[str]
+) -> str:
     """
     Determine seniority level: Junior, Mid, Senior, or Lead.
     """
-    title_lower = title.lower()
-    combined_text = (title + " " + full_text).lower()
-
-    if any(
-        keyword in title_lower
-        for keyword in ["lead", "principal", "staff", "director", "head", "chief"]
-    ):
+    if _contains_any(_LEAD_TITLE_KEYWORDS, title_lower):
         return "Lead"
-    elif "senior" in title_lower or "sr." in title_lower:
+    elif _contains_any(_SENIOR_TITLE_KEYWORDS, title_lower):
         return "Senior"
-    elif any(
-        keyword in title_lower for keyword in ["junior", "jr.", "entry", "associate"]
-    ):
+    elif _contains_any(_JUNIOR_TITLE_KEYWORDS, title_lower):
         return "Junior"
 
-    years_exp = _extract_years_experience(full_text)
-
-    has_advanced_degree = any(
-        keyword in combined_text for keyword in ["phd", "ph.d", "m.sc", "master"]
+    has_advanced_degree = _contains_any(
+        _ADVANCED_DEGREE_KEYWORDS, title_lower, full_text
     )
 
-    has_leadership = any(
-        keyword in combined_text
-        for keyword in [
-            "lead team",
-            "mentor",
-            "autonomy",
-            "independently",
-            "ownership",
-            "drive",
-            "strategy",
-            "architecture decision",
-        ]
-    )
+    has_leadership = _contains_any(_LEADERSHIP_KEYWORDS, title_lower, full_text)
 
     if years_exp >= 7 or has_advanced_degree and years_exp >= 5:
         return "Lead"
@@ -221,32 +264,39 @@ def extract_job_info(html: str) -> Dict:
         html: HTML string containing job posting
 
     Returns:
-        Dictionary with extracted and enriched job information
+        Dictionary with extracted and enriched job information, or an empty
+        dictionary if the page has no content
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = _parse_html(html)
+    if tree is None:
+        return {}
 
-    title = soup.find("h1").text.strip() if soup.find("h1") else ""
-    full_text = soup.get_text().lower()
+    title = _TITLE_XPATH(tree).strip()
+    full_text = "".join(_PAGE_TEXT_XPATH(tree)).lower()
 
-    requirements = []
-    requirements_section = soup.find(
-        "div", class_="career-text-block__wrp--data--requirements"
-    )
-    if requirements_section:
-        req_items = requirements_section.find_all("li")
-        requirements = [item.text.strip() for item in req_items]
+    requirements = [
+        item.text_content().strip() for item in _REQUIREMENT_ITEMS_XPATH(tree)
+    ]
 
-    responsibilities = []
-    desc_section = soup.find("div", class_="careers-text-block__desc")
-    if desc_section:
-        resp_items = desc_section.find_all("li")
-        responsibilities = [item.text.strip() for item in resp_items]
+    responsibilities = [
+        item.text_content().strip() for item in _RESPONSIBILITY_ITEMS_XPATH(tree)
+    ]
 
-    complexity_score = _calculate_complexity_score(title, full_text, requirements)
+    # Lowercase the title and extract the years of experience once; the scorers
+    # below share these instead of each recomputing them. Title and page text
+    # are searched separately rather than copied into one combined string.
+    title_lower = title.lower()
+    years_exp = _extract_years_experience(full_text)
+
+    complexity_score = _calculate_complexity_score(
+        title_lower, full_text, years_exp, requirements
+    )
 
-    category = _categorize_position(title, full_text, responsibilities)
+    category = _categorize_position(title_lower, full_text)
 
-    seniority_level = _determine_seniority(title, full_text, requirements)
+    seniority_level = _determine_seniority(
+        title_lower, full_text, years_exp, requirements
+    )
 
     return {
         "title": title,
@@ -261,21 +311,16 @@ def extract_job_info(html: str) -> Dict:
 
 def extract_positions(html: str) -> list[dict[str, str]]:
     """Extract position information from HTML content."""
-    soup = BeautifulSoup(html, "html.parser")
+    tree = _parse_html(html)
+    if tree is None:
+        return []
     positions = []
 
-    response_jobs_div = soup.find("div", id="response_jobs")
-
-    if response_jobs_div:
-        job_links = response_jobs_div.find_all("a")
-
-        for i, link in enumerate(job_links):
-            title_element = link.find("span", class_="link-text")
-            if title_element:
-                title = title_element.get_text(strip=True)
-                url = link.get("href", "")
-                positions.append(
-                    {"position_title": title, "index": str(i), "job_url": url}
-                )
+    for i, link in enumerate(_JOB_LINKS_XPATH(tree)):
+        title_elements = _LINK_TITLE_XPATH(link)
+        if title_elements:
+            title = "".join(text.strip() for text in title_elements[0].itertext())
+            url = link.get("href", "")
+            positions.append({"position_title": title, "index": str(i), "job_url": url})
 
     return positions
@@ -3,9 +3,11 @@ Web scraper with robust error handling and retry logic.
 """
 
 import asyncio
+import codecs
 import logging
 from typing import List, Dict, Optional, Callable
 import aiohttp
+from aiolimiter import AsyncLimiter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -15,6 +17,28 @@ from tenacity import (
 
 logger = logging.getLogger(__name__)
 
+# Extra seconds idle connections are kept beyond the rate-limit interval
+KEEPALIVE_GRACE_SECONDS = 15
+# Cap on pooled connections to any single host
+MAX_CONNECTIONS_PER_HOST = 16
+# Seconds resolved host addresses are cached by the connector
+DNS_CACHE_TTL_SECONDS = 300
+
+
+def _codec_name(charset: Optional[str]) -> str:
+    """
+    Return a codec for the declared charset, falling back to UTF-8.
+
+    Servers sometimes declare labels Python has no codec for (e.g. MySQL's
+    "utf8mb4"); those pages are decoded as UTF-8 rather than failing.
+    """
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            logger.debug("Unknown charset %r, decoding as utf-8", charset)
+    return "utf-8"
+
 
 class Scrapper:
     """
@@ -23,30 +47,44 @@ class Scrapper:
     Features:
     - Configurable timeout and rate limiting
     - Automatic retry on transient failures
-    - Session reuse for better performance
+    - One session and connection pool reused for the scraper's lifetime
     - Proper cleanup via context manager or explicit close
 
     Attributes:
         scrape_timeout (int): HTTP request timeout in seconds
-        scrape_rate_limit (int): Delay between requests in seconds
+        scrape_rate_per_sec (float): Maximum requests started per second
+        max_connections (int): Size of the pooled keep-alive connection set
         session (Optional[aiohttp.ClientSession]): Reusable HTTP session
     """
 
-    def __init__(self, scrape_timeout: int, scrape_rate_limit: int):
+    def __init__(
+        self,
+        scrape_timeout: int,
+        scrape_rate_per_sec: float,
+        max_connections: int = 64,
+    ):
         """
         Initialize the scraper.
 
         Args:
             scrape_timeout (int): Maximum time to wait for HTTP responses (seconds)
-            scrape_rate_limit (int): Minimum delay between requests (seconds)
+            scrape_rate_per_sec (float): Maximum requests started per second,
+                shared by all concurrent scrapes; may be below 1, e.g. 0.05
+                for one request every 20 seconds
+            max_connections (int): Maximum number of pooled connections; concurrent
+                scrapes beyond this wait for a free keep-alive connection
         """
         logger.info(
-            f"Initializing Scrapper (timeout={scrape_timeout}s, "
-            f"rate_limit={scrape_rate_limit}s)"
+            "Initializing Scrapper (timeout=%ss, rate=%s/s)",
+            scrape_timeout,
+            scrape_rate_per_sec,
         )
 
         self.scrape_timeout = scrape_timeout
-        self.scrape_rate_limit = scrape_rate_limit
+        self.scrape_rate_per_sec = scrape_rate_per_sec
+        # One request per interval, spaced evenly rather than in bursts
+        self._limiter = AsyncLimiter(1, 1 / scrape_rate_per_sec)
+        self.max_connections = max_connections
         self.session: Optional[aiohttp.ClientSession] = None
 
         self.headers = {
@@ -58,6 +96,45 @@ class Scrapper:
 
         logger.debug("Scrapper initialized")
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session backed by a pooled keep-alive connector.
+
+        Connections are kept alive long enough to outlast the rate-limit
+        interval, so consecutive scrapes of the same host reuse the TCP+TLS
+        connection instead of handshaking again. Resolved addresses are
+        cached for DNS_CACHE_TTL_SECONDS.
+
+        Returns:
+            aiohttp.ClientSession: Configured HTTP session
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=1 / self.scrape_rate_per_sec + KEEPALIVE_GRACE_SECONDS,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.scrape_timeout),
+            headers=self.headers,
+        )
+
+    async def start(self) -> None:
+        """
+        Create the HTTP session if it is not already open.
+
+        Call once before scraping; the session and its connection pool are
+        then reused until close(). Calling it again on an open session is a
+        no-op.
+        """
+        if self.session and not self.session.closed:
+            logger.debug("Scrapper session already started")
+            return
+
+        logger.debug("Creating Scrapper session")
+        self.session = self._create_session()
+
     async def __aenter__(self):
         """
         Async context manager entry - creates HTTP session.
@@ -66,10 +143,7 @@ class Scrapper:
             Scrapper: Self for context manager usage
         """
         logger.debug("Entering Scrapper context, creating session")
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.scrape_timeout),
-            headers=self.headers,
-        )
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -94,42 +168,37 @@ class Scrapper:
             str: HTML content of the page
 
         Raises:
+            RuntimeError: If start() has not been called
             aiohttp.ClientError: On HTTP errors (after retries)
             asyncio.TimeoutError: On timeout (after retries)
-            Exception: On unexpected errors
 
         Note:
             Retries up to 3 times with exponential backoff (2-10 seconds)
         """
-        # Create session if not already created
         if not self.session:
-            logger.debug("Creating new session in _fetch_page")
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.scrape_timeout),
-                headers=self.headers,
-            )
+            raise RuntimeError("Scrapper session not started; call start() first")
 
         try:
-            logger.debug(f"Fetching URL: {url}")
+            await self._limiter.acquire()
+            logger.debug("Fetching URL: %s", url)
             async with self.session.get(url) as response:
                 response.raise_for_status()
-                content = await response.text()
+                body = await response.read()
+                content = body.decode(_codec_name(response.charset), "replace")
                 logger.debug(
-                    f"Successfully fetched {url} ({len(content)} bytes, "
-                    f"status={response.status})"
+                    "Successfully fetched %s (%d bytes, status=%d)",
+                    url,
+                    len(body),
+                    response.status,
                 )
                 return content
 
         except aiohttp.ClientError as e:
-            logger.warning(f"HTTP error fetching {url}: {e}")
-            raise
-
-        except asyncio.TimeoutError as e:
-            logger.warning(f"Timeout fetching {url} after {self.scrape_timeout}s")
+            logger.warning("HTTP error fetching %s: %s", url, e)
             raise
 
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {url}: {e}", exc_info=True)
+        except asyncio.TimeoutError:
+            logger.warning("Timeout fetching %s after %ss", url, self.scrape_timeout)
             raise
 
     async def scrape(
@@ -147,30 +216,81 @@ class Scrapper:
             Optional[List[Dict[str, str]]]: Extracted data, or None on error
 
         Note:
-            - Respects rate_limit by sleeping before each request
+            - Requests are rate limited in _fetch_page, including retries
+            - The extractor runs in a worker thread, off the event loop
             - Logs warnings if no data is extracted
             - Returns None instead of raising on extraction errors
         """
         try:
-            logger.debug(
-                f"Rate limiting: sleeping {self.scrape_rate_limit}s before scrape"
-            )
-            await asyncio.sleep(self.scrape_rate_limit)
-
             html = await self._fetch_page(url)
-            logger.debug(f"Extracting data from {url}")
+            logger.debug("Extracting data from %s", url)
 
-            data = extractor(html)
+            # Parsing and scoring are CPU-bound; run them in a worker thread
+            # so concurrent fetches keep progressing on the event loop
+            data = await asyncio.to_thread(extractor, html)
 
             if not data:
-                logger.warning(f"No data extracted from {url}")
+                logger.warning("No data extracted from %s", url)
 
             return data
 
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Already logged per attempt by _fetch_page
+            logger.warning("Scraping failed for %s: %s", url, e)
+            return None
+
         except Exception as e:
-            logger.error(f"Scraping failed for {url}: {e}", exc_info=True)
+            logger.error("Scraping failed for %s: %s", url, e, exc_info=True)
             return None
 
+    async def _scrape_one(
+        self,
+        url: str,
+        extractor: Callable[[str], List[Dict[str, str]]],
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Scrape a single URL once a concurrency slot is free.
+
+        Args:
+            url (str): URL to scrape
+            extractor (Callable): Function to extract data from HTML
+            semaphore (asyncio.Semaphore): Shared concurrency bound
+
+        Returns:
+            Optional[List[Dict[str, str]]]: Extracted data, or None on error
+        """
+        async with semaphore:
+            return await self.scrape(url=url, extractor=extractor)
+
+    async def scrape_many(
+        self,
+        urls: List[str],
+        extractor: Callable[[str], List[Dict[str, str]]],
+        max_concurrency: int = 16,
+    ) -> List[Optional[List[Dict[str, str]]]]:
+        """
+        Scrape several URLs concurrently.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            extractor (Callable): Function to extract data from HTML
+            max_concurrency (int): Maximum number of scrapes in flight
+
+        Returns:
+            List[Optional[List[Dict[str, str]]]]: Extracted data per URL, in
+                the order of urls; None where scraping failed
+
+        Note:
+            - Requests still start no faster than scrape_rate_per_sec across
+              all concurrent scrapes; max_concurrency bounds how many are in
+              flight while slow responses are awaited
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(
+            *[self._scrape_one(url, extractor, semaphore) for url in urls]
+        )
+
     async def close(self) -> None:
         """
         Close the HTTP session and clean up resources.